@@ -46,16 +46,24 @@ try
         -- Safari起動（既に起動していても問題なし）
         activate
         
-        -- 少し待機してSafariが完全に起動するまで待つ
-        delay 2
+        -- ウィンドウが利用可能になるまで待機（固定待機ではなくポーリング、最大2秒）
+        repeat 20 times
+            if (count of windows) > 0 then exit repeat
+            delay 0.1
+        end repeat
         
         -- 新規タブでターゲットURLを開く
         tell window 1
-            make new tab with properties {URL:"$TARGET_URL"}
+            set targetTab to make new tab with properties {URL:"$TARGET_URL"}
         end tell
         
-        -- ページ読み込み完了まで待機
-        delay 3
+        -- ページ読み込み完了（ソース取得可能）まで待機（最大3秒）
+        repeat 30 times
+            try
+                if (source of targetTab) is not "" then exit repeat
+            end try
+            delay 0.1
+        end repeat
         
     end tell
     
@@ -84,8 +92,11 @@ try
         quit
     end tell
     
-    -- Safariが完全に終了するまで待機
-    delay 2
+    -- Safariが完全に終了するまで待機（最大2秒）
+    repeat 20 times
+        if application "Safari" is not running then exit repeat
+        delay 0.1
+    end repeat
     
     return "SUCCESS: Safari closed"
     
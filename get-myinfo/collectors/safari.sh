@@ -47,27 +47,6 @@ fi
 TARGET_DATE=$(date -v-1d '+%Y-%m-%d')
 log "Collecting Safari history for date: $TARGET_DATE"
 
-# JSON文字列エスケープ関数
-escape_json_string() {
-    local input="$1"
-    # 制御文字と特殊文字をエスケープ
-    printf '%s\n' "$input" | \
-    sed 's/\\/\\\\/g' | \
-    sed 's/"/\\"/g' | \
-    sed 's/	/\\t/g' | \
-    sed 's/$/\\n/g' | tr -d '\n' | \
-    sed 's/\\n$//' | \
-    sed 's/\x08/\\b/g' | \
-    sed 's/\x0C/\\f/g' | \
-    sed 's/\x0D/\\r/g'
-}
-
-# JSON検証関数
-validate_json() {
-    local json_string="$1"
-    echo "$json_string" | jq empty 2>/dev/null
-}
-
 # Safari履歴を取得するSQLクエリ
 # Safariのタイムスタンプは Mac絶対時間 (2001-01-01からの秒数)  
 # Unix時間に変換するため 978307200 を加算
@@ -87,38 +66,19 @@ ORDER BY MIN(visit_time) ASC;
 "
 
 # SQLクエリ実行とJSON形式出力（Unit Separator文字を使用）
-sqlite3 -separator $'\x1F' "$SAFARI_HISTORY_DB" "$SQL_QUERY" | while IFS=$'\x1F' read -r time title url count; do
-    
-    # visit_countが数値であることを確認
-    if ! [[ "$count" =~ ^[0-9]+$ ]]; then
-        log "WARN: Invalid visit count '$count' for URL '$url', setting to 1"
-        count=1
-    fi
-    
-    # JSON文字列エスケープ
-    escaped_title=$(escape_json_string "$title")
-    escaped_url=$(escape_json_string "$url")
-    
-    # JSON生成
-    json_record=$(cat << EOF
-{
-  "timestamp": "$time",
-  "title": "$escaped_title",
-  "url": "$escaped_url",
-  "visit_count": $count,
-  "source": "safari",
-  "date": "$TARGET_DATE"
-}
-EOF
-)
-    
-    # JSON検証
-    if validate_json "$json_record"; then
-        echo "$json_record"
-    else
-        log "WARN: Skipping malformed JSON record for URL: $escaped_url"
-        log "DEBUG: Malformed JSON: $json_record"
-    fi
-done
+# 行ごとにsed/jqを起動せず、1回のjq呼び出しでエスケープ・数値検証・JSON生成をまとめて行う
+sqlite3 -separator $'\x1F' "$SAFARI_HISTORY_DB" "$SQL_QUERY" | \
+jq -R --arg date "$TARGET_DATE" '
+  split("\u001f")
+  | select(length >= 4)
+  | {
+      timestamp: .[0],
+      title: .[1],
+      url: .[2],
+      visit_count: (if (.[3] | test("^[0-9]+$")) then (.[3] | tonumber) else 1 end),
+      source: "safari",
+      date: $date
+    }
+'
 
 log "Safari history collection completed successfully"
\ No newline at end of file
@@ -41,8 +41,7 @@ fi
 OBSIDIAN_BASE_PATH="$USER_INFO_PATH"
 
 # 日付から年月を取得
-YEAR=$(echo "$TARGET_DATE" | cut -d'-' -f1)
-MONTH=$(echo "$TARGET_DATE" | cut -d'-' -f2)
+IFS='-' read -r YEAR MONTH _ <<< "$TARGET_DATE"
 
 # 出力ディレクトリを作成
 OUTPUT_DIR="$OBSIDIAN_BASE_PATH/$YEAR/$MONTH"
@@ -78,8 +77,7 @@ fi
 # Markdownコンテンツを追記
 cat "$MARKDOWN_FILE" >> "$OUTPUT_FILE"
 
-# 追加した行数をログ出力
-ADDED_LINES=$(wc -l < "$MARKDOWN_FILE")
-log "INFO: Successfully appended $ADDED_LINES lines to $OUTPUT_FILE"
+# 追加した行数をログ出力（行数は上で取得済み）
+log "INFO: Successfully appended $CONTENT_SIZE lines to $OUTPUT_FILE"
 
 echo "Successfully updated diary file: $OUTPUT_FILE"
\ No newline at end of file
@@ -10,7 +10,8 @@ import os
 import re
 import logging
 import sys
-from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timedelta
 from pathlib import Path
 from typing import List, Dict, Optional
 
@@ -18,10 +19,31 @@ from typing import List, Dict, Optional
 sys.path.insert(0, str(Path(__file__).parent.parent))
 from shared.config_loader import get_config
 from shared.api_clients.azure_openai_client import AzureOpenAIClient
-from shared.api_clients.line_notify_client import LineNotifyClient
+from shared.api_clients.line_notify_client import get_shared_line_client
 from shared.utils.file_utils import sanitize_filename, ensure_directory, format_date_for_path, get_file_with_date_placeholder
 
 
+# Map legacy keys to new common config keys
+CONFIG_KEY_MAPPINGS = {
+    'azure_openai.api_key_env': 'AZURE_OPENAI_API_KEY',
+    'azure_openai.base_url': 'AZURE_OPENAI_BASE_URL',
+    'azure_openai.model': 'AZURE_OPENAI_DEPLOYMENT',
+    'line.token_env': 'LINE_NOTIFY_TOKEN',
+    'line.api_url': 'LINE_NOTIFY_API_URL',
+    'paths.research_report': 'RESEARCH_REPORT_PATH',
+    'paths.prompt_template': 'RADIO_PROMPT_TEMPLATE_PATH',
+    'paths.output_base': 'RADIO_OUTPUT_PATH',
+    'settings.chapter_marker': 'CHAPTER_MARKER',
+    'settings.api_delay': 'API_DELAY',
+    'settings.max_retries': 'MAX_RETRIES',
+    'settings.log_level': 'LOG_LEVEL'
+}
+
+# Numbered chapter lines: 1. **Title** or 1. ****Title**** or 1. Simple Title
+NUMBERED_LINE_PATTERN = re.compile(r'^\d+\.')
+CHAPTER_PATTERN = re.compile(r'(\d+)\.\s*(?:\*{2,4}([^*\n]+)\*{2,4}|([^\n]+))')
+
+
 class RadioGeneratorConfig:
     """Configuration management for the radio generator - now using common config."""
     
@@ -36,24 +58,8 @@ class RadioGeneratorConfig:
         
     def get(self, key_path: str, default=None):
         """Get configuration value using dot notation."""
-        # Map legacy keys to new common config keys
-        key_mappings = {
-            'azure_openai.api_key_env': 'AZURE_OPENAI_API_KEY',
-            'azure_openai.base_url': 'AZURE_OPENAI_BASE_URL',
-            'azure_openai.model': 'AZURE_OPENAI_DEPLOYMENT',
-            'line.token_env': 'LINE_NOTIFY_TOKEN',
-            'line.api_url': 'LINE_NOTIFY_API_URL',
-            'paths.research_report': 'RESEARCH_REPORT_PATH',
-            'paths.prompt_template': 'RADIO_PROMPT_TEMPLATE_PATH', 
-            'paths.output_base': 'RADIO_OUTPUT_PATH',
-            'settings.chapter_marker': 'CHAPTER_MARKER',
-            'settings.api_delay': 'API_DELAY',
-            'settings.max_retries': 'MAX_RETRIES',
-            'settings.log_level': 'LOG_LEVEL'
-        }
-        
-        if key_path in key_mappings:
-            env_key = key_mappings[key_path]
+        if key_path in CONFIG_KEY_MAPPINGS:
+            env_key = CONFIG_KEY_MAPPINGS[key_path]
             # 特別なフォーマット処理
             if key_path == 'paths.research_report':
                 base_path = self.common_config.get(env_key)
@@ -90,24 +96,26 @@ class ChapterExtractor:
         # Find the first substantial content block (stop at next major heading or empty line patterns)
         lines = after_marker.split('\n')
         chapter_section = []
+        numbered_lines = 0
         
         for i, line in enumerate(lines):
+            stripped = line.strip()
             # Stop at next major section or when we see repeated patterns
-            if (i > 0 and line.strip() and 
-                (line.startswith('##') or line.startswith('#') or 
-                 (i > 20 and line.strip().startswith('0.')))):  # Stop if we see another "0." after some content
+            if (i > 0 and stripped and 
+                (line.startswith('#') or 
+                 (i > 20 and stripped.startswith('0.')))):  # Stop if we see another "0." after some content
                 break
             chapter_section.append(line)
             # Stop after finding a reasonable number of chapters (to avoid duplicates)
-            if len([l for l in chapter_section if re.match(r'^\d+\.', l.strip())]) > 15:
-                break
+            if NUMBERED_LINE_PATTERN.match(stripped):
+                numbered_lines += 1
+                if numbered_lines > 15:
+                    break
         
         chapter_text = '\n'.join(chapter_section)
         
         # Extract numbered chapters using regex
-        # Pattern matches: 1. **Title** or 1. ****Title**** or 1. Simple Title
-        chapter_pattern = r'(\d+)\.\s*(?:\*{2,4}([^*\n]+)\*{2,4}|([^\n]+))'
-        raw_matches = re.findall(chapter_pattern, chapter_text)
+        raw_matches = CHAPTER_PATTERN.findall(chapter_text)
         
         # Process matches (handle both bold and plain formats) and deduplicate
         matches = []
@@ -268,7 +276,7 @@ class LineNotifier:
     
     def __init__(self, config: RadioGeneratorConfig):
         self.config = config
-        self.client = LineNotifyClient()  # Use common client
+        self.client = get_shared_line_client()  # Shared across generators (reuses the HTTP session)
     
     def send_notification(self, message: str) -> bool:
         """Send notification message via LINE."""
@@ -319,24 +327,24 @@ class RadioGenerator:
             logging.info(f"Starting radio generation for date: {date}")
             
             # Step 1: Read research report
-            logging.info("Reading research report...")
+            logging.info(f"[{date}] Reading research report...")
             research_report = self.file_manager.read_research_report(date)
             
             # Step 2: Extract chapters
-            logging.info("Extracting chapters...")
+            logging.info(f"[{date}] Extracting chapters...")
             chapters = self.chapter_extractor.extract_chapters(research_report)
-            logging.info(f"Found {len(chapters)} chapters")
+            logging.info(f"[{date}] Found {len(chapters)} chapters")
             
             # Step 3: Create output directory
             output_dir = self.file_manager.create_output_directory(date)
-            logging.info(f"Output directory: {output_dir}")
+            logging.info(f"[{date}] Output directory: {output_dir}")
             
             # Step 4: Generate scripts for all chapters
-            logging.info("Generating radio scripts...")
+            logging.info(f"[{date}] Generating radio scripts...")
             scripts = self.script_generator.generate_all_scripts(chapters, research_report)
             
             # Step 5: Save all chapter scripts
-            logging.info("Saving chapter scripts...")
+            logging.info(f"[{date}] Saving chapter scripts...")
             saved_files = []
             for script_data in scripts:
                 filepath = self.file_manager.save_chapter_script(
@@ -357,7 +365,7 @@ class RadioGenerator:
             
             self.line_notifier.send_notification(success_message)
             
-            logging.info("Radio generation completed successfully!")
+            logging.info(f"[{date}] Radio generation completed successfully!")
             
             return {
                 'success': True,
@@ -371,7 +379,7 @@ class RadioGenerator:
         except Exception as e:
             error_message = f"ラジオ原稿生成エラー ❌\n\n日付: {date}\nエラー: {str(e)}\n時刻: {datetime.now().strftime('%H:%M:%S')}"
             
-            logging.error(f"Radio generation failed: {e}")
+            logging.error(f"[{date}] Radio generation failed: {e}")
             self.line_notifier.send_notification(error_message)
             
             return {
@@ -381,25 +389,109 @@ class RadioGenerator:
             }
 
 
+def _parse_date(value: str) -> datetime:
+    """Parse a YYYY-MM-DD string, raising ValueError with a readable message."""
+    try:
+        return datetime.strptime(value.strip(), '%Y-%m-%d')
+    except ValueError:
+        raise ValueError(f"Invalid date '{value.strip()}' (expected YYYY-MM-DD)") from None
+
+
+def parse_dates(date_arg: Optional[str]) -> List[Optional[str]]:
+    """
+    Parse the --date argument into a list of dates.
+    
+    Accepts a single date, a comma-separated list (2025-09-07,2025-09-08)
+    or an inclusive range (2025-09-01..2025-09-07). None means today.
+    Raises ValueError for malformed dates, reversed ranges or an empty list.
+    """
+    if date_arg is None:
+        return [None]
+    
+    dates = []
+    for part in date_arg.split(','):
+        part = part.strip()
+        if not part:
+            continue
+        if '..' in part:
+            start_str, end_str = part.split('..', 1)
+            start = _parse_date(start_str)
+            end = _parse_date(end_str)
+            if start > end:
+                raise ValueError(f"Date range '{part}' is reversed")
+            while start <= end:
+                dates.append(start.strftime('%Y-%m-%d'))
+                start += timedelta(days=1)
+        else:
+            dates.append(_parse_date(part).strftime('%Y-%m-%d'))
+    
+    if not dates:
+        raise ValueError(f"No dates given in '{date_arg}'")
+    
+    return dates
+
+
+def process_dates(dates: List[Optional[str]], config_file: str, 
+                  concurrency: int = 1) -> List[Dict[str, any]]:
+    """
+    Process reports for several dates.
+    
+    Each date gets its own RadioGenerator (the conversation history is per report),
+    so dates can run in parallel threads; the work is bound by API latency.
+    A failure for one date (including generator setup) is reported as a
+    {'success': False} result and does not discard the other dates.
+    """
+    def process(date):
+        try:
+            return RadioGenerator(config_file).process_report(date)
+        except Exception as e:
+            logging.error(f"Radio generation failed for {date}: {e}")
+            return {'success': False, 'error': str(e), 'date': date}
+    
+    if concurrency <= 1 or len(dates) <= 1:
+        return [process(date) for date in dates]
+    
+    results = {}
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        futures = {executor.submit(process, date): i for i, date in enumerate(dates)}
+        for future in as_completed(futures):
+            results[futures[future]] = future.result()
+    
+    # Report results in the order the dates were given
+    return [results[i] for i in range(len(dates))]
+
+
 def main():
     """Main entry point."""
     import argparse
     
     parser = argparse.ArgumentParser(description='ラジオ原稿自動生成システム')
-    parser.add_argument('--date', type=str, help='処理する日付 (YYYY-MM-DD)')
+    parser.add_argument('--date', type=str, 
+                       help='処理する日付 (YYYY-MM-DD、カンマ区切りまたは YYYY-MM-DD..YYYY-MM-DD で複数指定)')
     parser.add_argument('--config', type=str, default='radio_config.json', 
                        help='設定ファイルのパス')
+    parser.add_argument('--concurrency', type=int, default=1,
+                       help='複数日付を処理する際の並列数 (default: 1)')
     
     args = parser.parse_args()
     
-    generator = RadioGenerator(args.config)
-    result = generator.process_report(args.date)
+    try:
+        dates = parse_dates(args.date)
+    except ValueError as e:
+        parser.error(str(e))
+    
+    results = process_dates(dates, args.config, args.concurrency)
+    
+    failed = False
+    for result in results:
+        if result['success']:
+            print(f"✅ 処理完了: {result['chapters_count']}章を生成")
+            print(f"📁 出力先: {result['output_dir']}")
+        else:
+            print(f"❌ 処理失敗: {result['error']}")
+            failed = True
     
-    if result['success']:
-        print(f"✅ 処理完了: {result['chapters_count']}章を生成")
-        print(f"📁 出力先: {result['output_dir']}")
-    else:
-        print(f"❌ 処理失敗: {result['error']}")
+    if failed:
         exit(1)
 
 
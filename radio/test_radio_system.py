@@ -11,7 +11,8 @@ from pathlib import Path
 from radio_generator import (
     RadioGeneratorConfig, 
     ChapterExtractor, 
-    FileManager
+    FileManager,
+    parse_dates
 )
 
 
@@ -45,6 +46,22 @@ def test_chapter_extraction():
     return chapters
 
 
+def test_chapter_extraction_limit():
+    """章数上限（重複防止）のテスト"""
+    print("🧪 章数上限テスト...")
+    
+    numbered = "\n".join(f"{i}. **章{i}**" for i in range(1, 31))
+    sample_content = f"#automation/research-chapter\n{numbered}\n"
+    
+    extractor = ChapterExtractor()
+    chapters = extractor.extract_chapters(sample_content)
+    
+    assert len(chapters) == 16, f"期待: 16章, 実際: {len(chapters)}章"
+    assert chapters[-1]['title'] == "章16", "最終章のタイトルが正しくない"
+    
+    print("✅ 章数上限テスト完了")
+
+
 def test_config_loading():
     """設定ファイル読み込みテスト"""
     print("🧪 設定ファイル読み込みテスト...")
@@ -100,6 +117,28 @@ def test_file_operations():
     print("✅ ファイル操作テスト完了")
 
 
+def test_parse_dates():
+    """日付引数パーステスト"""
+    print("🧪 日付引数パーステスト...")
+    
+    assert parse_dates(None) == [None], "未指定時は当日(None)になっていない"
+    assert parse_dates("2025-09-07") == ["2025-09-07"]
+    assert parse_dates("2025-09-07, 2025-09-09") == ["2025-09-07", "2025-09-09"]
+    assert parse_dates("2025-08-30..2025-09-02") == [
+        "2025-08-30", "2025-08-31", "2025-09-01", "2025-09-02"
+    ], "範囲指定の展開が正しくない"
+    
+    # 不正な指定はValueErrorになる（逆順の範囲・空リスト・不正な日付）
+    for invalid in ["2025-09-07..2025-09-01", ",", "", "bad..2025-01-01", "2025-13-01"]:
+        try:
+            parse_dates(invalid)
+        except ValueError:
+            continue
+        raise AssertionError(f"不正な指定が受理された: {invalid!r}")
+    
+    print("✅ 日付引数パーステスト完了")
+
+
 def test_full_system_flow():
     """システム全体のフロー（API呼び出し除く）テスト"""
     print("🧪 システム全体フローテスト...")
@@ -172,9 +211,15 @@ def main():
         test_chapter_extraction()
         print()
         
+        test_chapter_extraction_limit()
+        print()
+        
         test_file_operations()
         print()
         
+        test_parse_dates()
+        print()
+        
         test_full_system_flow()
         print()
         
@@ -9,17 +9,45 @@ Obsidian日記から注目ワードを抽出し、選択されたProviderでリ
 """
 
 import os
+import sys
 import argparse
+import hashlib
 from datetime import datetime, timedelta
 import logging
 import re
-from typing import List, Optional, Dict
+from functools import lru_cache, cached_property
+from pathlib import Path
+from typing import List, Optional, Dict, Tuple
+
+# 共通ライブラリを追加
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from shared.utils.file_utils import read_file_cached
 
 from providers.factory import ProviderFactory
 from providers.base import ResearchProvider
 
+# 入力ハッシュから除外する設定キー（秘密情報）の接尾辞
+_SECRET_KEY_SUFFIXES = ('_KEY', '_TOKEN', '_SECRET')
+
+# 本文中の引用番号 [数字]
+_CITATION_PATTERN = re.compile(r'\[(\d+)\]')
+
+
+@lru_cache(maxsize=16)
+def _parse_config_file(config_path: str, mtime_ns: int) -> Tuple[Tuple[str, str], ...]:
+    """設定ファイルを解析（パスと更新時刻をキーにキャッシュし、未変更なら再解析しない）"""
+    entries = []
+    with open(config_path, 'r', encoding='utf-8') as f:
+        for line in f:
+            if '=' in line and not line.startswith('#'):
+                key, value = line.strip().split('=', 1)
+                entries.append((key, value.strip('"\'')))
+    return tuple(entries)
+
+
 class AutoResearchSystem:
-    def __init__(self, provider_type: str = "perplexity", config_path: str = None, debug: bool = False):
+    def __init__(self, provider_type: str = "perplexity", config_path: str = None, debug: bool = False,
+                 force: bool = False):
         """
         初期化
         
@@ -27,9 +55,11 @@ class AutoResearchSystem:
             provider_type: 使用するプロバイダー ('perplexity' or 'langchain')
             config_path: カスタム設定ファイルのパス
             debug: デバッグモード
+            force: 同一入力のレポートが既に存在してもリサーチを再実行する
         """
         self.provider_type = provider_type
         self.debug = debug
+        self.force = force
         self.config = self._load_hierarchical_config(config_path)
         self.setup_logging()
         self.provider = self._create_provider()
@@ -43,13 +73,11 @@ class AutoResearchSystem:
         # 1. Default .env file
         self._load_config_file(".env", config)
         
-        # 2. Provider-specific config
-        provider_config_path = f"config/{self.provider_type}.env"
-        if os.path.exists(provider_config_path):
-            self._load_config_file(provider_config_path, config)
+        # 2. Provider-specific config（存在しなければ_load_config_fileが無視する）
+        self._load_config_file(f"config/{self.provider_type}.env", config)
         
         # 3. Custom config file if specified
-        if custom_config_path and os.path.exists(custom_config_path):
+        if custom_config_path:
             self._load_config_file(custom_config_path, config)
         
         # 4. Environment variables override
@@ -62,12 +90,30 @@ class AutoResearchSystem:
     
     def _load_config_file(self, config_path: str, config: Dict[str, str]):
         """単一設定ファイル読み込み"""
-        if os.path.exists(config_path):
-            with open(config_path, 'r', encoding='utf-8') as f:
-                for line in f:
-                    if '=' in line and not line.startswith('#'):
-                        key, value = line.strip().split('=', 1)
-                        config[key] = value.strip('"\'')
+        try:
+            mtime_ns = os.stat(config_path).st_mtime_ns
+        except OSError:
+            return
+        config.update(_parse_config_file(config_path, mtime_ns))
+    
+    def _get_setting(self, key: str) -> Optional[str]:
+        """環境変数を優先して設定値を取得"""
+        return os.environ.get(key) or self.config.get(key)
+    
+    @cached_property
+    def diary_base_path(self) -> Optional[str]:
+        """日記ディレクトリ"""
+        return self._get_setting('USER_INFO_PATH')
+    
+    @cached_property
+    def prompt_template_path(self) -> Optional[str]:
+        """プロンプトテンプレートファイル"""
+        return self._get_setting('PROMPT_TEMPLATE_PATH')
+    
+    @cached_property
+    def report_output_dir(self) -> Optional[str]:
+        """リサーチレポート出力ディレクトリ"""
+        return self._get_setting('RESEARCH_REPORT_PATH')
     
     def _create_provider(self) -> ResearchProvider:
         """プロバイダー作成"""
@@ -93,12 +139,12 @@ class AutoResearchSystem:
     
     def get_diary_files(self, days_back: int = 1) -> List[str]:
         """Obsidian日記ファイルのパスを取得"""
-        # 環境変数から直接取得
-        diary_base_path = os.environ.get('USER_INFO_PATH') or self.config.get('USER_INFO_PATH')
+        diary_base_path = self.diary_base_path
         diary_files = []
+        now = datetime.now()
         
         for i in range(1, days_back + 1):
-            target_date = datetime.now() - timedelta(days=i)
+            target_date = now - timedelta(days=i)
             year = target_date.strftime('%Y')
             month = target_date.strftime('%m')
             date_str = target_date.strftime('%Y-%m-%d')
@@ -112,14 +158,14 @@ class AutoResearchSystem:
     
     def read_diary_content(self, diary_files: List[str]) -> str:
         """日記内容を読み込み"""
-        content = ""
+        sections = []
         total_chars = 0
         
         for diary_file in diary_files:
             try:
                 with open(diary_file, 'r', encoding='utf-8') as f:
                     file_content = f.read()
-                    content += f"\n\n=== {os.path.basename(diary_file)} ===\n{file_content}"
+                    sections.append(f"\n\n=== {os.path.basename(diary_file)} ===\n{file_content}")
                     total_chars += len(file_content)
                     
                     # 前日の日記が3000文字以上の場合、前々日は不要
@@ -130,38 +176,75 @@ class AutoResearchSystem:
             except Exception as e:
                 self.logger.error(f"Error reading {diary_file}: {e}")
         
-        return content.strip()
+        return "".join(sections).strip()
     
-    def check_prompt_template_exists(self) -> bool:
-        """プロンプトテンプレートファイルの存在チェック"""
-        # 環境変数から直接取得
-        prompt_file_path = os.environ.get('PROMPT_TEMPLATE_PATH') or self.config.get('PROMPT_TEMPLATE_PATH')
+    def read_prompt_template(self) -> Optional[str]:
+        """プロンプトテンプレートファイルを読み込み（存在しない・読めない場合はNone）"""
+        prompt_file_path = self.prompt_template_path
         
-        if not os.path.exists(prompt_file_path):
+        try:
+            return read_file_cached(prompt_file_path)
+        except FileNotFoundError:
             self.logger.error(f"Prompt template file not found: {prompt_file_path}")
             self.logger.error("Stopping execution to avoid unnecessary API costs")
-            return False
-        return True
-    
-    def read_prompt_template(self) -> str:
-        """プロンプトテンプレートファイルを読み込み"""
-        # 環境変数から直接取得
-        prompt_file_path = os.environ.get('PROMPT_TEMPLATE_PATH') or self.config.get('PROMPT_TEMPLATE_PATH')
-        
-        try:
-            with open(prompt_file_path, 'r', encoding='utf-8') as f:
-                return f.read()
+            return None
         except Exception as e:
             self.logger.error(f"Error reading prompt template file: {e}")
-            return ""
+            return None
     
-    def generate_research_prompt(self, diary_content: str) -> str:
+    def generate_research_prompt(self, diary_content: str, prompt_template: Optional[str] = None) -> str:
         """日記内容とプロンプトテンプレートからリサーチプロンプトを生成"""
-        prompt_template = self.read_prompt_template()
+        if prompt_template is None:
+            prompt_template = self.read_prompt_template() or ""
         combined_prompt = f"{prompt_template}\n\n# 日記情報\n\n{diary_content}"
         
         return combined_prompt
     
+    def get_report_path(self, now: Optional[datetime] = None) -> str:
+        """本日のリサーチレポートのパス（ラジオ生成側が {date}.md を前提にしているため日付のみで命名）"""
+        today = (now or datetime.now()).strftime('%Y-%m-%d')
+        return os.path.join(self.report_output_dir, f"{today}.md")
+    
+    def compute_input_hash(self, prompt: str) -> str:
+        """
+        リサーチ結果に影響する入力から入力ハッシュを計算
+        
+        プロバイダー・プロンプト・設定値（APIキー等の秘密情報を除く）と、
+        設定で参照されるプロンプトテンプレート（*_PROMPT_PATH）の内容を対象とする。
+        各要素は区切り文字付きで連結し、境界の異なる入力が同じハッシュにならないようにする。
+        """
+        digest = hashlib.blake2b(digest_size=8)
+        
+        def update(name: str, value: str):
+            digest.update(f"{name}\0{value}\0".encode('utf-8'))
+        
+        update('provider', self.provider_type)
+        update('prompt', prompt)
+        
+        for key in sorted(self.config):
+            if key.endswith(_SECRET_KEY_SUFFIXES):
+                continue
+            value = self._get_setting(key) or ""
+            update(f"config:{key}", value)
+            
+            # サブテンプレート（LangChainのクエリ分解・エージェント用など）は内容も含める
+            if key.endswith('_PROMPT_PATH') and value:
+                try:
+                    update(f"template:{key}", read_file_cached(value))
+                except OSError:
+                    update(f"template:{key}", "")
+        
+        return digest.hexdigest()
+    
+    def is_report_up_to_date(self, input_hash: str) -> bool:
+        """同一入力から生成されたレポートが既に存在するかチェック"""
+        report_path = self.get_report_path()
+        try:
+            with open(report_path, 'r', encoding='utf-8') as f:
+                return f"<!-- input-hash: {input_hash} -->" in f.read()
+        except OSError:
+            return False
+    
     def conduct_research(self, prompt: str) -> Optional[Dict]:
         """選択されたプロバイダーでリサーチを実行"""
         self.logger.info(f"Conducting research with {self.provider.get_provider_name()} provider...")
@@ -172,7 +255,7 @@ class AutoResearchSystem:
         
         return self.provider.conduct_research(prompt)
     
-    def save_research_report(self, api_response) -> str:
+    def save_research_report(self, api_response, input_hash: Optional[str] = None) -> str:
         """リサーチレポートをMarkdownファイルとして保存"""
         # APIレスポンスの形式に応じて処理
         if isinstance(api_response, str):
@@ -193,16 +276,15 @@ class AutoResearchSystem:
             self.logger.error("Invalid API response format")
             return ""
         
-        # 環境変数から直接取得
-        output_dir = os.environ.get('RESEARCH_REPORT_PATH') or self.config.get('RESEARCH_REPORT_PATH')
+        output_dir = self.report_output_dir
         
         # ディレクトリ作成
         os.makedirs(output_dir, exist_ok=True)
         
-        # ファイル名生成
-        today = datetime.now().strftime('%Y-%m-%d')
-        filename = f"{today}.md"
-        filepath = os.path.join(output_dir, filename)
+        # ファイル名生成（日付・パス・生成日時は同一時刻から算出）
+        now = datetime.now()
+        today = now.strftime('%Y-%m-%d')
+        filepath = self.get_report_path(now)
         
         # 文章中の引用をクリック可能なリンクに変換
         if search_results:
@@ -215,18 +297,18 @@ class AutoResearchSystem:
                 return match.group(0)  # 元のまま
             
             # [数字] のパターンを置換
-            citation_pattern = r'\[(\d+)\]'
-            content = re.sub(citation_pattern, replace_citation, content)
+            content = _CITATION_PATTERN.sub(replace_citation, content)
         
         # 参考文献リストを追加
         citation_list = ""
         if search_results:
-            citation_list = "\n\n## 参考文献\n\n"
+            citation_lines = ["\n\n## 参考文献\n\n"]
             for i, result in enumerate(search_results, 1):
                 title = result.get('title', f'Source {i}')
                 url = result.get('url', '')
                 if url:
-                    citation_list += f"{i}. [{title}]({url})\n"
+                    citation_lines.append(f"{i}. [{title}]({url})\n")
+            citation_list = "".join(citation_lines)
         
         # メタデータセクション作成
         metadata_section = ""
@@ -239,11 +321,14 @@ class AutoResearchSystem:
 - **信頼度スコア**: {metadata.get('confidence_score', 0.0):.2f}
 """
 
+        # 入力ハッシュ（再実行時のキャッシュ判定用、Obsidian上では非表示）
+        hash_comment = f"<!-- input-hash: {input_hash} -->\n" if input_hash else ""
+        
         # Markdownコンテンツ作成
         markdown_content = f"""# 自動リサーチレポート - {today}
 
-生成日時: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-{metadata_section}
+生成日時: {now.strftime('%Y-%m-%d %H:%M:%S')}
+{hash_comment}{metadata_section}
 ---
 
 {content}{citation_list}
@@ -281,27 +366,34 @@ class AutoResearchSystem:
                 self.logger.warning("No diary content found")
                 return
             
-            # 3. プロンプトテンプレートファイル存在チェック（API呼び出し前に実行）
-            if not self.check_prompt_template_exists():
+            # 3. プロンプトテンプレート読み込み（存在チェックを兼ねる。API呼び出し前に実行）
+            prompt_template = self.read_prompt_template()
+            if prompt_template is None:
                 self.logger.error("Prompt template file missing - aborting to prevent API costs")
                 return
             
             # 4. プロンプト生成
-            prompt = self.generate_research_prompt(diary_content)
+            prompt = self.generate_research_prompt(diary_content, prompt_template)
             
             if self.debug:
                 self.logger.debug("=== GENERATED PROMPT (FULL) ===")
                 self.logger.debug(prompt)
                 self.logger.debug("=== END PROMPT ===")
             
-            # 5. リサーチ実行
+            # 5. 同一入力のレポートが既にあればAPI呼び出しをスキップ
+            input_hash = self.compute_input_hash(prompt)
+            if not self.force and self.is_report_up_to_date(input_hash):
+                self.logger.info(f"Cache hit: report for the same input already exists, skipping research: {self.get_report_path()} (use --force to re-run)")
+                return
+            
+            # 6. リサーチ実行
             research_result = self.conduct_research(prompt)
             if not research_result:
                 self.logger.error(f"Failed to get research result from {self.provider.get_provider_name()} provider")
                 return
             
-            # 6. レポート保存
-            report_path = self.save_research_report(research_result)
+            # 7. レポート保存
+            report_path = self.save_research_report(research_result, input_hash)
             if report_path:
                 self.logger.info(f"Auto research completed successfully: {report_path}")
             else:
@@ -323,6 +415,7 @@ def create_argument_parser():
   python auto_research.py -p langchain --config custom.env  # カスタム設定
   python auto_research.py --list-providers                  # 利用可能プロバイダー一覧
   python auto_research.py --debug                           # デバッグモード
+  python auto_research.py --force                           # 同一入力のレポートがあっても再実行
 
 プロバイダー:
   perplexity: Perplexity API (既存システム)
@@ -349,6 +442,12 @@ def create_argument_parser():
         help='デバッグモードでログ出力を詳細化'
     )
     
+    parser.add_argument(
+        '--force',
+        action='store_true',
+        help='同一入力（日記・プロンプトテンプレート・設定値・プロバイダー）のレポートが既に存在してもリサーチを再実行'
+    )
+    
     parser.add_argument(
         '--list-providers',
         action='store_true',
@@ -375,7 +474,8 @@ def main():
         system = AutoResearchSystem(
             provider_type=args.provider,
             config_path=args.config,
-            debug=args.debug
+            debug=args.debug,
+            force=args.force
         )
         
         # リサーチ実行
@@ -3,8 +3,17 @@ Provider module for auto-research system
 """
 
 from .base import ResearchProvider
-from .perplexity_provider import PerplexityProvider
-from .langchain_provider import LangChainProvider
 from .factory import ProviderFactory
 
-__all__ = ['ResearchProvider', 'PerplexityProvider', 'LangChainProvider', 'ProviderFactory']
\ No newline at end of file
+# Concrete providers are resolved lazily through the factory registry
+_LAZY_PROVIDERS = {
+    'PerplexityProvider': 'perplexity',
+    'LangChainProvider': 'langchain',
+}
+
+def __getattr__(name):
+    if name in _LAZY_PROVIDERS:
+        return ProviderFactory._get_provider_class(_LAZY_PROVIDERS[name])
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+__all__ = ['ResearchProvider', 'PerplexityProvider', 'LangChainProvider', 'ProviderFactory']
@@ -2,11 +2,18 @@
 Provider factory for creating research providers
 """
 
-from typing import Dict, Any
+from typing import Dict, Any, Type
+from functools import lru_cache
+import importlib
 import logging
 from .base import ResearchProvider
-from .perplexity_provider import PerplexityProvider
-from .langchain_provider import LangChainProvider
+
+# Provider name -> (module, class name). Modules are imported on first use so that
+# e.g. a perplexity run does not pay for importing the LangChain provider's dependencies.
+PROVIDER_REGISTRY = {
+    "perplexity": (".perplexity_provider", "PerplexityProvider"),
+    "langchain": (".langchain_provider", "LangChainProvider"),
+}
 
 class ProviderFactory:
     """Factory for creating research providers"""
@@ -29,15 +36,22 @@ class ProviderFactory:
         """
         provider_type = provider_type.lower()
         
-        if provider_type == "perplexity":
-            return PerplexityProvider(config, logger)
-        elif provider_type == "langchain":
-            return LangChainProvider(config, logger)
-        else:
-            available_providers = ["perplexity", "langchain"]
+        if provider_type not in PROVIDER_REGISTRY:
+            available_providers = ProviderFactory.get_available_providers()
             raise ValueError(f"Unknown provider: {provider_type}. Available providers: {available_providers}")
+        
+        provider_class = ProviderFactory._get_provider_class(provider_type)
+        return provider_class(config, logger)
+    
+    @staticmethod
+    @lru_cache(maxsize=None)
+    def _get_provider_class(provider_type: str) -> Type[ResearchProvider]:
+        """Resolve (and cache) the provider class for a registered provider type"""
+        module_name, class_name = PROVIDER_REGISTRY[provider_type]
+        module = importlib.import_module(module_name, package=__package__)
+        return getattr(module, class_name)
     
     @staticmethod
     def get_available_providers() -> list:
         """Get list of available providers"""
-        return ["perplexity", "langchain"]
\ No newline at end of file
+        return list(PROVIDER_REGISTRY)
@@ -2,13 +2,13 @@
 LangChain provider for auto-research system with Azure OpenAI, Search API, and Multi-agent coordination
 """
 
-import os
 import json
 import asyncio
 import concurrent.futures
-from typing import Dict, Any, Optional, List
+from typing import Dict, Any, Optional, List, Tuple
 from dataclasses import dataclass
 from .base import ResearchProvider
+from shared.utils.file_utils import read_file_cached
 
 from pydantic import BaseModel
 
@@ -39,6 +39,21 @@ class ResearchContent(BaseModel):
     key_findings: str
     implementation_insights: str
     future_prospects: str
+    
+    def to_markdown(self) -> str:
+        """Render the four research sections as markdown"""
+        return f"""## 現状分析
+{self.current_analysis}
+
+## 重要な発見・トレンド
+{self.key_findings}
+
+## 実用化への示唆
+{self.implementation_insights}
+
+## 今後の展望
+{self.future_prospects}
+"""
 
 class AgentResult(BaseModel):
     agent_id: str
@@ -55,13 +70,14 @@ class FinalReport(BaseModel):
     actionable_recommendations: str
     future_research_topics: str
 
-class ResearchSupervisor:
-    """Supervisor for multi-agent research coordination"""
-    
-    def __init__(self, openai_client, logger, config=None):
-        self.client = openai_client
-        self.logger = logger
-        self.config = config
+def _resolve_model_settings(config: Optional[Dict[str, Any]]) -> Tuple[str, int]:
+    """Resolve deployment name and completion token limit once per component"""
+    if not config:
+        return 'gpt-4', 3000
+    return config.get('AZURE_OPENAI_DEPLOYMENT', 'gpt-4'), int(config.get('MAX_COMPLETION_TOKENS', 3000))
+
+class PromptTemplateMixin:
+    """Shared prompt template loading for components holding `config` and `logger`"""
     
     def _load_prompt_template(self, config_key: str, fallback_content: str = "") -> str:
         """Load prompt template from file"""
@@ -71,13 +87,30 @@ class ResearchSupervisor:
             return fallback_content
         
         try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                self.logger.debug(f"Loaded prompt template from {prompt_path}")
-                return content
+            content = read_file_cached(prompt_path).strip()
+            self.logger.debug("Loaded prompt template from %s", prompt_path)
+            return content
         except Exception as e:
             self.logger.error(f"Failed to load prompt template {prompt_path}: {e}")
             return fallback_content
+
+class ResearchSupervisor(PromptTemplateMixin):
+    """Supervisor for multi-agent research coordination"""
+    
+    def __init__(self, openai_client, logger, config=None):
+        self.client = openai_client
+        self.logger = logger
+        self.config = config
+        self.model, self.max_completion_tokens = _resolve_model_settings(config)
+    
+    @staticmethod
+    def _fallback_sub_queries(context: str) -> List[SubQuery]:
+        """Default decomposition used when the model output cannot be used"""
+        return [
+            SubQuery(query="技術動向と最新の進展", priority=1, domain="技術動向", context=context[:500]),
+            SubQuery(query="実用化・実装における課題と解決策", priority=2, domain="実装手法", context=context[:500]),
+            SubQuery(query="将来の展望と影響分析", priority=2, domain="将来展望", context=context[:500])
+        ]
     
     def decompose_query(self, query: str, context: str) -> List[SubQuery]:
         """Decompose main query into sub-queries for parallel processing"""
@@ -103,14 +136,14 @@ class ResearchSupervisor:
         
         self.logger.info(f"=== PHASE 1: Query Decomposition ===")
         self.logger.info(f"Prompt template path: {self.config.get('QUERY_DECOMPOSITION_PROMPT_PATH', 'Using fallback')}")
-        self.logger.debug(f"Decomposition prompt (first 500 chars): {decomposition_prompt[:500]}...")
+        self.logger.debug("Decomposition prompt (first 500 chars): %s...", decomposition_prompt[:500])
         
         try:
             response = self.client.beta.chat.completions.parse(
-                model=self.config.get('AZURE_OPENAI_DEPLOYMENT', 'gpt-4'),
+                model=self.model,
                 messages=[{"role": "user", "content": decomposition_prompt}],
                 response_format=QueryDecomposition,
-                max_completion_tokens=int(self.config.get('MAX_COMPLETION_TOKENS', 3000)),
+                max_completion_tokens=self.max_completion_tokens,
                 temperature=1
             )
             
@@ -118,7 +151,7 @@ class ResearchSupervisor:
             if decomposition and decomposition.sub_queries:
                 return decomposition.sub_queries[:3]  # Limit to 3 sub-queries
             
-            content = response.choices[0].message.content
+            content = response.choices[0].message.content or ""
             sub_queries = []
             
             # Parse the response to extract sub-queries
@@ -149,48 +182,26 @@ class ResearchSupervisor:
                             context=context[:500]  # Truncate context
                         ))
             
+            if sub_queries:
+                return sub_queries[:3]  # Limit to 3 sub-queries
+            
             # Fallback to default decomposition
             self.logger.warning("Query decomposition failed, using fallback")
-            return [
-                SubQuery(query="技術動向と最新の進展", priority=1, domain="技術動向", context=context[:500]),
-                SubQuery(query="実用化・実装における課題と解決策", priority=2, domain="実装手法", context=context[:500]),
-                SubQuery(query="将来の展望と影響分析", priority=2, domain="将来展望", context=context[:500])
-            ]
-            
-            return sub_queries[:3]  # Limit to 3 sub-queries
+            return self._fallback_sub_queries(context)
             
         except Exception as e:
             self.logger.error(f"Error in query decomposition: {e}")
             # Fallback
-            return [
-                SubQuery(query="技術動向と最新の進展", priority=1, domain="技術動向", context=context[:500]),
-                SubQuery(query="実用化・実装における課題と解決策", priority=2, domain="実装手法", context=context[:500]),
-                SubQuery(query="将来の展望と影響分析", priority=2, domain="将来展望", context=context[:500])
-            ]
+            return self._fallback_sub_queries(context)
 
-class ContextCompressor:
+class ContextCompressor(PromptTemplateMixin):
     """Context compression for token optimization"""
     
     def __init__(self, openai_client, logger, config=None):
         self.client = openai_client
         self.logger = logger
         self.config = config
-    
-    def _load_prompt_template(self, config_key: str, fallback_content: str = "") -> str:
-        """Load prompt template from file"""
-        prompt_path = self.config.get(config_key)
-        if not prompt_path:
-            self.logger.warning(f"Prompt path {config_key} not found in config, using fallback")
-            return fallback_content
-        
-        try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                self.logger.debug(f"Loaded prompt template from {prompt_path}")
-                return content
-        except Exception as e:
-            self.logger.error(f"Failed to load prompt template {prompt_path}: {e}")
-            return fallback_content
+        self.model, self.max_completion_tokens = _resolve_model_settings(config)
     
     def compress_context(self, context: str, threshold: int = 4000) -> str:
         """Compress context if it exceeds threshold"""
@@ -210,7 +221,7 @@ class ContextCompressor:
         
         try:
             response = self.client.chat.completions.create(
-                model=self.config.get('AZURE_OPENAI_DEPLOYMENT', 'gpt-4'),
+                model=self.model,
                 messages=[{"role": "user", "content": compression_prompt}],
                 max_completion_tokens=1000,
                 temperature=1
@@ -225,7 +236,7 @@ class ContextCompressor:
             # Fallback to truncation
             return context[:threshold] + "\n\n[...内容が切り詰められました...]"
 
-class ResearchAgent:
+class ResearchAgent(PromptTemplateMixin):
     """Individual research agent for specialized queries"""
     
     def __init__(self, agent_id: str, openai_client, search_client, logger, config=None):
@@ -234,28 +245,13 @@ class ResearchAgent:
         self.search_client = search_client
         self.logger = logger
         self.config = config
-    
-    def _load_prompt_template(self, config_key: str, fallback_content: str = "") -> str:
-        """Load prompt template from file"""
-        prompt_path = self.config.get(config_key)
-        if not prompt_path:
-            self.logger.warning(f"Prompt path {config_key} not found in config, using fallback")
-            return fallback_content
-        
-        try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                self.logger.debug(f"Loaded prompt template from {prompt_path}")
-                return content
-        except Exception as e:
-            self.logger.error(f"Failed to load prompt template {prompt_path}: {e}")
-            return fallback_content
+        self.model, self.max_completion_tokens = _resolve_model_settings(config)
     
     def conduct_specialized_research(self, sub_query: SubQuery) -> AgentResult:
         """Conduct specialized research for a sub-query"""
         self.logger.info(f"=== PHASE 2: Agent {self.agent_id} Research ({sub_query.domain}) ===")
         self.logger.info(f"Research query: {sub_query.query}")
-        self.logger.debug(f"Context (first 300 chars): {sub_query.context[:300]}...")
+        self.logger.debug("Context (first 300 chars): %s...", sub_query.context[:300])
         
         # Phase 3: Search integration
         search_results = []
@@ -277,9 +273,10 @@ class ResearchAgent:
         # Create specialized research prompt
         search_context = ""
         if search_results:
-            search_context = "\n\n参考情報:\n"
-            for i, result in enumerate(search_results, 1):
-                search_context += f"{i}. {result.get('title', '')}: {result.get('content', '')[:300]}\n"
+            search_context = "\n\n参考情報:\n" + "".join(
+                f"{i}. {result.get('title', '')}: {result.get('content', '')[:300]}\n"
+                for i, result in enumerate(search_results, 1)
+            )
         
         # Load prompt template from file
         prompt_template = self._load_prompt_template(
@@ -307,33 +304,22 @@ class ResearchAgent:
             search_context=search_context
         )
         
-        self.logger.info(f"Agent {self.agent_id} prompt template path: {self.config.get('RESEARCH_AGENT_PROMPT_PATH', 'Using fallback')}")
-        self.logger.debug(f"Agent {self.agent_id} research prompt (first 500 chars): {research_prompt[:500]}...")
+        self.logger.debug("Agent %s prompt template path: %s", self.agent_id, self.config.get('RESEARCH_AGENT_PROMPT_PATH', 'Using fallback'))
+        self.logger.debug("Agent %s research prompt (first 500 chars): %s...", self.agent_id, research_prompt[:500])
         self.logger.info(f"Agent {self.agent_id} found {len(search_results)} search results")
         
         try:
             response = self.openai_client.beta.chat.completions.parse(
-                model=self.config.get('AZURE_OPENAI_DEPLOYMENT', 'gpt-4') if self.config else 'gpt-4',
+                model=self.model,
                 messages=[{"role": "user", "content": research_prompt}],
                 response_format=ResearchContent,
-                max_completion_tokens=int(self.config.get('MAX_COMPLETION_TOKENS', 3000)),
+                max_completion_tokens=self.max_completion_tokens,
                 temperature=1
             )
             
             research_content = response.choices[0].message.parsed
             if research_content:
-                content = f"""## 現状分析
-{research_content.current_analysis}
-
-## 重要な発見・トレンド
-{research_content.key_findings}
-
-## 実用化への示唆
-{research_content.implementation_insights}
-
-## 今後の展望
-{research_content.future_prospects}
-"""
+                content = research_content.to_markdown()
             else:
                 content = "構造化出力の解析に失敗しました"
             
@@ -374,9 +360,11 @@ class ResearchAgent:
                 domain=sub_query.domain
             )
 
-class LangChainProvider(ResearchProvider):
+class LangChainProvider(PromptTemplateMixin, ResearchProvider):
     """LangChain provider with Azure OpenAI, Search API, and Multi-agent coordination"""
     
+    REQUIRED_CONFIG_KEYS = ('AZURE_OPENAI_API_KEY', 'AZURE_OPENAI_BASE_URL')
+    
     def __init__(self, config: Dict[str, Any], logger):
         super().__init__(config, logger)
         
@@ -398,9 +386,18 @@ class LangChainProvider(ResearchProvider):
             self.compressor = ContextCompressor(self.openai_client, logger, config)
         
         # Configuration
+        self.model, self.max_completion_tokens = _resolve_model_settings(config)
         self.max_sub_agents = int(config.get('MAX_SUB_AGENTS', 3))
         self.context_compression_threshold = int(config.get('CONTEXT_COMPRESSION_THRESHOLD', 4000))
         self.parallel_execution_timeout = int(config.get('PARALLEL_EXECUTION_TIMEOUT', 300))
+        
+        # Research agents are stateless between queries, so build them once and reuse
+        self.agents = []
+        if self.openai_client:
+            self.agents = [
+                ResearchAgent(f"agent_{i+1}", self.openai_client, self.search_client, logger, config)
+                for i in range(max(self.max_sub_agents, 1))
+            ]
     
     def _setup_openai_client(self):
         """Setup Azure OpenAI client"""
@@ -435,30 +432,12 @@ class LangChainProvider(ResearchProvider):
         except Exception as e:
             self.logger.error(f"Failed to setup search client: {e}")
     
-    def _load_prompt_template(self, config_key: str, fallback_content: str = "") -> str:
-        """Load prompt template from file"""
-        prompt_path = self.config.get(config_key)
-        if not prompt_path:
-            self.logger.warning(f"Prompt path {config_key} not found in config, using fallback")
-            return fallback_content
-        
-        try:
-            with open(prompt_path, 'r', encoding='utf-8') as f:
-                content = f.read().strip()
-                self.logger.debug(f"Loaded prompt template from {prompt_path}")
-                return content
-        except Exception as e:
-            self.logger.error(f"Failed to load prompt template {prompt_path}: {e}")
-            return fallback_content
-    
     def get_provider_name(self) -> str:
         return "langchain"
     
     def validate_config(self) -> bool:
         """Validate LangChain provider configuration"""
-        required_keys = ['AZURE_OPENAI_API_KEY', 'AZURE_OPENAI_BASE_URL']
-        
-        for key in required_keys:
+        for key in self.REQUIRED_CONFIG_KEYS:
             if not self.config.get(key):
                 self.logger.error(f"Required configuration {key} not found")
                 return False
@@ -507,8 +486,7 @@ class LangChainProvider(ResearchProvider):
                 with concurrent.futures.ThreadPoolExecutor(max_workers=self.max_sub_agents) as executor:
                     future_to_query = {}
                     
-                    for i, sub_query in enumerate(sub_queries[:self.max_sub_agents]):
-                        agent = ResearchAgent(f"agent_{i+1}", self.openai_client, self.search_client, self.logger, self.config)
+                    for agent, sub_query in zip(self.agents, sub_queries):
                         future = executor.submit(agent.conduct_specialized_research, sub_query)
                         future_to_query[future] = sub_query
                     
@@ -520,17 +498,23 @@ class LangChainProvider(ResearchProvider):
                             self.logger.error(f"Agent execution error: {e}")
             else:
                 # Single agent execution
-                agent = ResearchAgent("agent_1", self.openai_client, self.search_client, self.logger, self.config)
-                result = agent.conduct_specialized_research(sub_queries[0])
+                result = self.agents[0].conduct_specialized_research(sub_queries[0])
                 agent_results.append(result)
             
             # Phase 4: Synthesis and integration
             final_content = self._synthesize_agent_results(agent_results)
             
-            # Collect all sources
+            # Collect all sources (agents often hit the same pages; keep the first occurrence per URL)
             all_sources = []
+            seen_urls = set()
             for result in agent_results:
-                all_sources.extend(result.sources)
+                for source in result.sources:
+                    url = source.get('url')
+                    if url:
+                        if url in seen_urls:
+                            continue
+                        seen_urls.add(url)
+                    all_sources.append(source)
             
             return {
                 'content': final_content,
@@ -557,58 +541,48 @@ class LangChainProvider(ResearchProvider):
             self.logger.info(f"Agent {i}: {result.domain} (confidence: {result.confidence_score:.2f})")
         
         # Prepare agent results content
-        agent_results_text = ""
+        agent_sections = []
         for i, result in enumerate(agent_results, 1):
             if isinstance(result.content, ResearchContent):
-                content_text = f"""## 現状分析
-{result.content.current_analysis}
-
-## 重要な発見・トレンド
-{result.content.key_findings}
-
-## 実用化への示唆
-{result.content.implementation_insights}
-
-## 今後の展望
-{result.content.future_prospects}
-"""
+                content_text = result.content.to_markdown()
             else:
                 content_text = str(result.content)
             
-            agent_results_text += f"""## エージェント{i} - {result.domain}分野
+            agent_sections.append(f"""## エージェント{i} - {result.domain}分野
 研究クエリ: {result.query}
 
 {content_text}
 
 ---
 
-"""
+""")
+        agent_results_text = "".join(agent_sections)
         
         # Use original prompt template + agent results
         original_prompt_path = self.config.get('PROMPT_TEMPLATE_PATH')
         self.logger.info(f"Original prompt template path: {original_prompt_path}")
         
-        if original_prompt_path and os.path.exists(original_prompt_path):
+        synthesis_prompt = f"最終成果物を作成：\n\n{agent_results_text}"
+        if original_prompt_path:
             try:
-                with open(original_prompt_path, 'r', encoding='utf-8') as f:
-                    original_template = f.read()
-                self.logger.debug(f"Original template (first 300 chars): {original_template[:300]}...")
+                original_template = read_file_cached(original_prompt_path)
+                self.logger.debug("Original template (first 300 chars): %s...", original_template[:300])
                 synthesis_prompt = original_template.replace("# 日記情報", f"# エージェント研究結果\n\n{agent_results_text}")
                 self.logger.info("Successfully replaced diary section with agent results")
+            except FileNotFoundError:
+                self.logger.warning("Original prompt template not found, using fallback")
             except Exception as e:
                 self.logger.error(f"Failed to read original prompt template: {e}")
-                synthesis_prompt = f"最終成果物を作成：\n\n{agent_results_text}"
         else:
             self.logger.warning("Original prompt template not found, using fallback")
-            synthesis_prompt = f"最終成果物を作成：\n\n{agent_results_text}"
         
-        self.logger.debug(f"Final synthesis prompt (first 500 chars): {synthesis_prompt[:500]}...")
+        self.logger.debug("Final synthesis prompt (first 500 chars): %s...", synthesis_prompt[:500])
         
         try:
             response = self.openai_client.chat.completions.create(
-                model=self.config.get('AZURE_OPENAI_DEPLOYMENT', 'gpt-4'),
+                model=self.model,
                 messages=[{"role": "user", "content": synthesis_prompt}],
-                max_completion_tokens=int(self.config.get('MAX_COMPLETION_TOKENS', 3000)),
+                max_completion_tokens=self.max_completion_tokens,
                 temperature=1
             )
             
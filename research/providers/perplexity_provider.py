@@ -4,12 +4,36 @@ Perplexity API provider for auto-research system
 
 import requests
 import json
+import logging
 from typing import Dict, Any, Optional
 from .base import ResearchProvider
 
 class PerplexityProvider(ResearchProvider):
     """Perplexity API provider"""
     
+    API_URL = "https://api.perplexity.ai/chat/completions"
+    REQUEST_PARAMS = {
+        "model": "sonar-deep-research",
+        "reasoning_effort": "medium",
+        "temperature": 0.7,
+        "max_tokens": 8192
+    }
+    
+    def __init__(self, config: Dict[str, Any], logger: logging.Logger):
+        super().__init__(config, logger)
+        self._session = None
+    
+    @property
+    def session(self) -> requests.Session:
+        """HTTP session reused across requests (keeps the TLS connection alive)"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({
+                "Authorization": f"Bearer {self.config.get('PERPLEXITY_API_KEY')}",
+                "Content-Type": "application/json"
+            })
+        return self._session
+    
     def get_provider_name(self) -> str:
         return "perplexity"
     
@@ -34,26 +58,16 @@ class PerplexityProvider(ResearchProvider):
         if not self.validate_config():
             return None
             
-        api_key = self.config.get('PERPLEXITY_API_KEY')
-        url = "https://api.perplexity.ai/chat/completions"
-        headers = {
-            "Authorization": f"Bearer {api_key}",
-            "Content-Type": "application/json"
-        }
-        
         data = {
-            "model": "sonar-deep-research",
+            **self.REQUEST_PARAMS,
             "messages": [
                 {"role": "user", "content": prompt}
-            ],
-            "reasoning_effort": "medium",
-            "temperature": 0.7,
-            "max_tokens": 8192
+            ]
         }
         
         try:
             self.logger.info("Calling Perplexity API...")
-            response = requests.post(url, headers=headers, json=data, timeout=1200)
+            response = self.session.post(self.API_URL, json=data, timeout=1200)
             response.raise_for_status()
             
             result = response.json()
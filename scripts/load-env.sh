@@ -39,7 +39,7 @@ while IFS= read -r line; do
     if [[ "$line" =~ ^[A-Za-z_][A-Za-z0-9_]*= ]]; then
         # 環境変数として展開してエクスポート
         eval "export $line"
-        var_name=$(echo "$line" | cut -d'=' -f1)
+        var_name="${line%%=*}"
         log_env "Exported: $var_name"
     fi
 done < "$ENV_FILE"
@@ -6,13 +6,23 @@ Azure OpenAI 統一クライアント
 """
 
 from typing import List, Dict, Optional, Any
+import threading
 import time
-from openai import OpenAI
+from openai import OpenAI, AuthenticationError, BadRequestError, NotFoundError, PermissionDeniedError
 
 from ..config_loader import get_config
 from ..utils.logger_setup import LoggerMixin
 
 
+# 再試行しても結果が変わらないエラー（認証・権限・リクエスト内容・デプロイ名の誤り）
+_NON_RETRYABLE_ERRORS = (AuthenticationError, BadRequestError, NotFoundError, PermissionDeniedError)
+
+# API_DELAYによる呼び出し間隔はプロセス内の全クライアントで共有する
+# （複数日付の並列処理でもワーカー数倍のリクエストレートにならないように）
+_rate_limit_lock = threading.Lock()
+_last_call_time: Optional[float] = None
+
+
 class AzureOpenAIClient(LoggerMixin):
     """Azure OpenAI API統一クライアント"""
     
@@ -31,11 +41,18 @@ class AzureOpenAIClient(LoggerMixin):
         else:
             self.config = config.get_azure_openai_config()
         
-        self.client = self._init_openai_client()
+        self._client: Optional[OpenAI] = None
         self.conversation_history = []
         self.api_delay = float(config.get('API_DELAY', 2))
         self.max_retries = int(config.get('MAX_RETRIES', 3))
     
+    @property
+    def client(self) -> OpenAI:
+        """OpenAI クライアント（初回のAPI呼び出し時に初期化）"""
+        if self._client is None:
+            self._client = self._init_openai_client()
+        return self._client
+    
     def _init_openai_client(self) -> OpenAI:
         """OpenAI クライアントを初期化"""
         try:
@@ -47,6 +64,27 @@ class AzureOpenAIClient(LoggerMixin):
             self.logger.error(f"Failed to initialize Azure OpenAI client: {e}")
             raise
     
+    def _wait_for_rate_limit(self, pace: bool = True):
+        """
+        API呼び出し開始時刻を記録し、前回の呼び出し開始からapi_delay秒経過するまで待機
+        
+        呼び出し時刻は全クライアント共通で、ロック内で次の開始時刻を予約するため
+        並列ワーカーからの呼び出しもapi_delay間隔に並ぶ。
+        
+        Args:
+            pace: Falseの場合は待機せず開始時刻の記録のみ行う（リトライ時）
+        """
+        global _last_call_time
+        with _rate_limit_lock:
+            now = time.monotonic()
+            start = now
+            if pace and _last_call_time is not None and self.api_delay > 0:
+                start = max(now, _last_call_time + self.api_delay)
+            _last_call_time = start
+        
+        if start > now:
+            time.sleep(start - now)
+    
     def generate_completion(self, 
                           messages: List[Dict[str, str]], 
                           model: Optional[str] = None,
@@ -87,12 +125,18 @@ class AzureOpenAIClient(LoggerMixin):
             if max_tokens:
                 params['max_tokens'] = max_tokens
             
+            # クライアント初期化の失敗（キー・エンドポイント未設定など）は再試行しない
+            client = self.client
+            
             # リトライ機能付きでAPI呼び出し
             for attempt in range(self.max_retries):
                 try:
-                    self.logger.debug(f"API call attempt {attempt + 1}/{self.max_retries}")
+                    self.logger.debug("API call attempt %s/%s", attempt + 1, self.max_retries)
                     
-                    response = self.client.chat.completions.create(**params)
+                    # API制限対応の待機（前回呼び出し開始からの経過時間分は待たない）
+                    # リトライ時は指数バックオフで既に待機しているため行わない
+                    self._wait_for_rate_limit(pace=(attempt == 0))
+                    response = client.chat.completions.create(**params)
                     
                     content = response.choices[0].message.content
                     
@@ -103,13 +147,11 @@ class AzureOpenAIClient(LoggerMixin):
                             'content': content
                         })
                     
-                    # API制限対応の待機
-                    if self.api_delay > 0:
-                        time.sleep(self.api_delay)
-                    
                     self.logger.debug("API call successful")
                     return content
                 
+                except _NON_RETRYABLE_ERRORS:
+                    raise
                 except Exception as e:
                     self.logger.warning(f"API call attempt {attempt + 1} failed: {e}")
                     if attempt < self.max_retries - 1:
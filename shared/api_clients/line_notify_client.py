@@ -5,6 +5,7 @@ LINE Notify 統一クライアント
 全ワークフローで共有されるLINE Notify APIクライアント
 """
 
+import threading
 from typing import Optional
 import requests
 
@@ -32,10 +33,24 @@ class LineNotifyClient(LoggerMixin):
         
         self.token = self.config.get('token')
         self.api_url = self.config['api_url']
+        self._session: Optional[requests.Session] = None
+        # 共有クライアントは並列実行中のRadioGeneratorから呼ばれるため、セッションの作成と利用を直列化
+        self._session_lock = threading.Lock()
         
         if not self.token:
             self.logger.warning("LINE Notify token not configured - notifications will be disabled")
     
+    @property
+    def session(self) -> requests.Session:
+        """認証ヘッダー設定済みのHTTPセッション（初回アクセス時に作成し接続を再利用、_session_lock保持中に使用）"""
+        if self._session is None:
+            self._session = requests.Session()
+            self._session.headers.update({
+                'Authorization': f'Bearer {self.token}',
+                'Content-Type': 'application/x-www-form-urlencoded'
+            })
+        return self._session
+    
     def send_message(self, message: str, 
                     sticker_package_id: Optional[int] = None,
                     sticker_id: Optional[int] = None) -> bool:
@@ -55,11 +70,6 @@ class LineNotifyClient(LoggerMixin):
             return False
         
         try:
-            headers = {
-                'Authorization': f'Bearer {self.token}',
-                'Content-Type': 'application/x-www-form-urlencoded'
-            }
-            
             data = {'message': message}
             
             # スタンプが指定された場合は追加
@@ -67,19 +77,19 @@ class LineNotifyClient(LoggerMixin):
                 data['stickerPackageId'] = sticker_package_id
                 data['stickerId'] = sticker_id
             
-            response = requests.post(
-                self.api_url,
-                headers=headers,
-                data=data,
-                timeout=10
-            )
+            with self._session_lock:
+                response = self.session.post(
+                    self.api_url,
+                    data=data,
+                    timeout=10
+                )
             
             if response.status_code == 200:
                 self.logger.info("LINE notification sent successfully")
                 return True
             else:
                 self.logger.error(f"LINE notification failed: HTTP {response.status_code}")
-                self.logger.debug(f"Response: {response.text}")
+                self.logger.debug("Response: %s", response.text)
                 return False
         
         except Exception as e:
@@ -167,9 +177,21 @@ def create_line_client() -> LineNotifyClient:
     return LineNotifyClient()
 
 
+_shared_client = None
+_shared_client_lock = threading.Lock()
+
+def get_shared_line_client() -> LineNotifyClient:
+    """便利関数用の共有クライアントを取得（HTTP接続を呼び出し間で再利用、スレッドセーフ）"""
+    global _shared_client
+    with _shared_client_lock:
+        if _shared_client is None:
+            _shared_client = create_line_client()
+    return _shared_client
+
+
 def send_radio_completion_notice(chapters_count: int, output_dir: str, date: str) -> bool:
     """ラジオ台本生成完了通知"""
-    client = create_line_client()
+    client = get_shared_line_client()
     
     message = f"""📻 ラジオ台本生成完了
 
@@ -183,7 +205,7 @@ def send_radio_completion_notice(chapters_count: int, output_dir: str, date: str
 
 def send_research_completion_notice(query: str, output_file: str) -> bool:
     """リサーチ完了通知"""
-    client = create_line_client()
+    client = get_shared_line_client()
     
     message = f"""🔍 自動リサーチ完了
 
@@ -196,5 +218,5 @@ def send_research_completion_notice(query: str, output_file: str) -> bool:
 
 def send_error_notice(workflow_name: str, error_message: str) -> bool:
     """エラー通知"""
-    client = create_line_client()
+    client = get_shared_line_client()
     return client.send_error_message(f"{workflow_name} エラー", error_message)
\ No newline at end of file
@@ -6,11 +6,21 @@
 """
 
 import os
+import re
 from pathlib import Path
 from typing import Dict, List, Optional, Any
 import logging
 
 
+# ${VAR}形式の環境変数参照（.env読み込み時に1度だけコンパイル）
+_ENV_VAR_PATTERN = re.compile(r'\$\{([^}]+)\}')
+
+
+def _expand_env_var(match: re.Match) -> str:
+    """${VAR}を環境変数の値に置換（未定義の場合はそのまま）"""
+    return os.environ.get(match.group(1), match.group(0))
+
+
 class ConfigError(Exception):
     """設定関連のエラー"""
     pass
@@ -66,12 +76,7 @@ class CommonConfig:
                     value = value.strip().strip('"\'')  # クォートを除去
                     
                     # 環境変数の展開を行う（${VAR}形式）
-                    import re
-                    def expand_var(match):
-                        var_name = match.group(1)
-                        return os.environ.get(var_name, match.group(0))
-                    
-                    value = re.sub(r'\$\{([^}]+)\}', expand_var, value)
+                    value = _ENV_VAR_PATTERN.sub(_expand_env_var, value)
                     
                     # 環境変数として設定（既存の環境変数を優先）
                     if key not in os.environ:
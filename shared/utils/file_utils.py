@@ -7,9 +7,14 @@
 
 import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Union
+
+
+# ファイル名に使用できない文字
+_INVALID_FILENAME_CHARS = re.compile(r'[<>:"/\\|?*]')
 
 
 def sanitize_filename(filename: str) -> str:
@@ -23,7 +28,7 @@ def sanitize_filename(filename: str) -> str:
         サニタイズされたファイル名
     """
     # 禁止文字を除去・置換
-    filename = re.sub(r'[<>:"/\\|?*]', '', filename)
+    filename = _INVALID_FILENAME_CHARS.sub('', filename)
     filename = filename.replace(' ', '_')
     filename = filename.replace('　', '_')  # 全角スペースも置換
     
@@ -75,6 +80,33 @@ def read_file_safe(file_path: Path, encoding: str = 'utf-8') -> Optional[str]:
         return None
 
 
+@lru_cache(maxsize=64)
+def _read_file_by_mtime(path: str, mtime_ns: int, encoding: str) -> str:
+    """read_file_cachedの実体（mtimeをキーに含めることで更新時に自動で無効化される）"""
+    with open(path, 'r', encoding=encoding) as f:
+        return f.read()
+
+
+def read_file_cached(file_path: Union[str, Path], encoding: str = 'utf-8') -> str:
+    """
+    ファイルを読み込み、更新されていなければメモリ上のキャッシュを返す
+    
+    テンプレートのように同一プロセス内で何度も読まれるファイル向け
+    
+    Args:
+        file_path: ファイルパス
+        encoding: エンコーディング
+        
+    Returns:
+        ファイル内容
+        
+    Raises:
+        OSError: ファイルが存在しない・読み込めない場合
+    """
+    path = os.fspath(file_path)
+    return _read_file_by_mtime(path, os.stat(path).st_mtime_ns, encoding)
+
+
 def write_file_safe(file_path: Path, content: str, encoding: str = 'utf-8') -> bool:
     """
     ファイルを安全に書き込み
@@ -8,10 +8,13 @@
 import logging
 import sys
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
 from ..config_loader import get_config
 
 
+# 設定済みロガーの構成（ロガー名 → (ログファイル, レベル, フォーマット)）
+_configured_loggers: Dict[str, Tuple[Optional[Path], str, str]] = {}
+
 def setup_logger(name: str, 
                 log_file: Optional[Path] = None,
                 log_level: Optional[str] = None,
@@ -39,9 +42,17 @@ def setup_logger(name: str,
     
     # ロガーを作成
     logger = logging.getLogger(name)
+    
+    # 同じ構成で設定済みならハンドラーを作り直さずそのまま返す
+    settings = (log_file, log_level, format_string)
+    if _configured_loggers.get(name) == settings:
+        return logger
+    
     logger.setLevel(getattr(logging, log_level.upper(), logging.INFO))
     
-    # 既存のハンドラーをクリア（重複防止）
+    # 既存のハンドラーを閉じてクリア（重複防止）
+    for handler in logger.handlers:
+        handler.close()
     logger.handlers.clear()
     
     # フォーマッターを作成
@@ -61,6 +72,7 @@ def setup_logger(name: str,
         file_handler.setFormatter(formatter)
         logger.addHandler(file_handler)
     
+    _configured_loggers[name] = settings
     return logger
 
 